@@ -1,8 +1,20 @@
 # -*- coding: utf-8 -*-
-from fastapi import APIRouter, Depends, HTTPException
-from app.core.security import verify_token
-from app.models.schemas import ResumeData
-from app.services.resume_generator import generate_resume
+import asyncio
+import json
+import re
+import unicodedata
+from urllib.parse import quote
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from app.core.config import get_settings
+from app.core.security import verify_token, verify_websocket_token
+from app.models.schemas import KeywordMatchRequest, ResumeData
+from app.services.resume_generator import generate_resume, render_resume, resume_etag
+from app.services.keyword_matcher import get_matcher
+from app.services.resume_index import get_resume_index
+from app.services.live_preview import PreviewSession
 
 router = APIRouter()
 
@@ -50,4 +62,136 @@ async def create_resume(resume_data: ResumeData):
             "file_path": file_path
         }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e)) 
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an If-None-Match entity-tag list against an ETag using weak comparison
+    """
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+def content_disposition(filename: str) -> str:
+    """
+    Build an inline Content-Disposition header with an ASCII-safe filename and
+    an RFC 5987 UTF-8 filename* for clients that support it
+    """
+    ascii_name = unicodedata.normalize("NFKD", filename).encode("ascii", "ignore").decode()
+    ascii_name = re.sub(r"[^A-Za-z0-9.-]+", "_", ascii_name).strip("_") or "resume.pdf"
+    if ascii_name.startswith("."):
+        ascii_name = "resume" + ascii_name
+    return f"inline; filename=\"{ascii_name}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+@router.post("/render",
+    tags=["Resume"],
+    summary="Render a resume",
+    description="Renders a resume and returns the PDF directly. Identical input yields byte-identical PDFs with a strong ETag; "
+                "send it back in If-None-Match to get a 304 without re-rendering. Requires JWT authentication.",
+    response_class=Response,
+    responses={
+        200: {"content": {"application/pdf": {}}},
+        304: {"description": "Not Modified"},
+        412: {"description": "Precondition Failed, for If-None-Match: *"}
+    },
+    dependencies=[Depends(verify_token)])
+async def render_resume_pdf(resume_data: ResumeData, if_none_match: Optional[str] = Header(None)):
+    etag = resume_etag(resume_data)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match:
+        # A rendition always exists, so "*" can never pass on a POST (RFC 9110)
+        if if_none_match.strip() == "*":
+            return Response(status_code=412)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=cache_headers)
+    try:
+        pdf = await run_in_threadpool(render_resume, resume_data)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    filename = f"{resume_data.full_name.replace(' ', '_')}.pdf"
+    return Response(
+        content=pdf,
+        media_type="application/pdf",
+        headers={
+            **cache_headers,
+            "Content-Disposition": content_disposition(filename)
+        }
+    )
+
+@router.post("/match",
+    tags=["Resume"],
+    summary="Match resumes against a job description",
+    description="Scores a batch of resumes against the keywords of a job description and returns matched and missing "
+                "keywords with coverage per section. Requires JWT authentication.",
+    dependencies=[Depends(verify_token)])
+async def match_resumes(request: KeywordMatchRequest):
+    job = request.job_description
+    keywords = tuple(job.keywords) if job.keywords else None
+
+    def score_batch():
+        matcher = get_matcher(job.text, keywords)
+        return matcher, [matcher.score(resume_data) for resume_data in request.resumes]
+
+    matcher, results = await run_in_threadpool(score_batch)
+    return {
+        "keywords": matcher.keywords,
+        "dropped_keywords": matcher.dropped,
+        "results": results
+    }
+
+@router.get("/search",
+    tags=["Resume"],
+    summary="Search generated resumes",
+    description="Full-text search over generated resumes by name, profession, skills, companies and experience. "
+                "Results are ranked by relevance and paginated. Requires JWT authentication.",
+    dependencies=[Depends(verify_token)])
+async def search_resumes(
+    q: str = Query(min_length=1, description="Search terms; all terms must match"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100)
+):
+    total, results = await run_in_threadpool(
+        get_resume_index().search, q, page_size, (page - 1) * page_size
+    )
+    return {
+        "query": q,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "results": results
+    }
+
+@router.websocket("/preview")
+async def live_preview(websocket: WebSocket):
+    """
+    Live preview channel. The client sends successive ResumeData snapshots as
+    JSON text frames; the server debounces them and replies with a JSON header
+    followed by the PDF of the latest snapshot as a binary frame. Superseded
+    snapshots are never sent back.
+    """
+    payload = await verify_websocket_token(websocket)
+    if payload is None:
+        return
+    await websocket.accept()
+
+    session = PreviewSession(websocket, payload["sub"], get_settings().PREVIEW_DEBOUNCE_SECONDS)
+    renderer = asyncio.create_task(session.run())
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            if message.get("text") is None:
+                await websocket.send_json({"error": "Snapshots must be sent as JSON text frames"})
+                continue
+            try:
+                session.submit(ResumeData.model_validate_json(message["text"]))
+            except ValidationError as e:
+                await websocket.send_json({
+                    "error": "Invalid resume data",
+                    "detail": json.loads(e.json(include_url=False))
+                })
+    except WebSocketDisconnect:
+        pass
+    finally:
+        renderer.cancel()
+        await asyncio.gather(renderer, return_exceptions=True)
@@ -19,6 +19,19 @@ class Settings(BaseSettings):
     JWT_SECRET: str = os.getenv("JWT_SECRET", "ai_reume_anty_dolphin")
     ALGORITHM: str = "HS256"
     
+    # Live preview settings
+    PREVIEW_DEBOUNCE_SECONDS: float = 0.3
+    
+    # Maximum number of compiled (template, theme) style sets kept in memory
+    STYLE_CACHE_SIZE: int = 256
+    
+    # Maximum number of job description keyword matchers kept in memory
+    MATCHER_CACHE_SIZE: int = 128
+    
+    # Full-text search index over generated resumes
+    SEARCH_INDEX_PATH: str = "generated_resumes/search_index.db"
+    SEARCH_INDEX_BATCH_SIZE: int = 100
+    
     class Config:
         case_sensitive = True
 
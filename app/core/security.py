@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, WebSocket, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 import os
@@ -15,16 +15,48 @@ ALGORITHM = "HS256"
 # Security scheme
 security = HTTPBearer()
 
+def decode_token(token: str):
+    """
+    Decode a JWT token, raising JWTError if it is invalid
+    """
+    return jwt.decode(token, JWT_SECRET, algorithms=[ALGORITHM])
+
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """
     Verify the JWT token
     """
     try:
-        payload = jwt.decode(credentials.credentials, JWT_SECRET, algorithms=[ALGORITHM])
+        payload = decode_token(credentials.credentials)
         return payload
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
-        ) 
\ No newline at end of file
+        )
+
+async def verify_websocket_token(websocket: WebSocket):
+    """
+    Verify the JWT token of a WebSocket connection.
+
+    Browsers cannot set headers on WebSocket handshakes, so the token may be
+    passed either as a Bearer Authorization header or as a ``token`` query
+    parameter. Live previews are rate limited per user, so the token must
+    carry a ``sub`` claim. Returns None after closing the socket if the token
+    is invalid or has no subject.
+    """
+    token = websocket.query_params.get("token")
+    authorization = websocket.headers.get("authorization", "")
+    scheme, _, credentials = authorization.partition(" ")
+    if scheme.lower() == "bearer" and credentials:
+        token = credentials
+    try:
+        if not token:
+            raise JWTError("Missing token")
+        payload = decode_token(token)
+        if not payload.get("sub"):
+            raise JWTError("Missing subject")
+        return payload
+    except JWTError:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Could not validate credentials")
+        return None
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Optional, Literal
 
+HEX_COLOR_PATTERN = r"^#[0-9A-Fa-f]{6}$"
+
 class Education(BaseModel):
     institution: str
     degree: str
@@ -21,6 +23,44 @@ class Skill(BaseModel):
     category: str
     skills: List[str]
 
+class Theme(BaseModel):
+    """
+    Visual overrides for a template. Unset fields fall back to the template's
+    own defaults.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    primary_color: Optional[str] = Field(
+        default=None,
+        pattern=HEX_COLOR_PATTERN,
+        description="Hex color for the name and main headings, e.g. #1976D2"
+    )
+    accent_color: Optional[str] = Field(
+        default=None,
+        pattern=HEX_COLOR_PATTERN,
+        description="Hex color for section headings and highlights"
+    )
+    text_color: Optional[str] = Field(
+        default=None,
+        pattern=HEX_COLOR_PATTERN,
+        description="Hex color for body text"
+    )
+    font_family: Optional[Literal["Helvetica", "Times-Roman", "Courier"]] = Field(
+        default=None,
+        description="Choose font family: Helvetica, Times-Roman, or Courier"
+    )
+    base_font_size: Optional[float] = Field(
+        default=None,
+        ge=7,
+        le=14,
+        description="Body text size in points; headings scale with it"
+    )
+
+    @field_validator("primary_color", "accent_color", "text_color")
+    @classmethod
+    def normalize_color(cls, value):
+        return value.lower() if value else value
+
 class ResumeData(BaseModel):
     template_name: Literal["ats_friendly", "modern_ats", "classic", "professional_ats", "modern_two_column"] = Field(
         description="Choose template style: ats_friendly, modern_ats, classic, professional_ats, or modern_two_column"
@@ -33,4 +73,20 @@ class ResumeData(BaseModel):
     summary: str
     education: List[Education]
     experience: List[Experience]
-    skills: List[Skill] 
\ No newline at end of file
+    skills: List[Skill]
+    theme: Optional[Theme] = None 
+
+class JobDescription(BaseModel):
+    text: str
+    keywords: Optional[List[str]] = Field(
+        default=None,
+        description="Keywords to match. Extracted from the text when omitted"
+    )
+
+class KeywordMatchRequest(BaseModel):
+    job_description: JobDescription
+    resumes: List[ResumeData] = Field(
+        min_length=1,
+        max_length=500,
+        description="Resumes to score, at most 500 per request"
+    )
\ No newline at end of file
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+import re
+from collections import deque
+from functools import lru_cache
+from app.core.config import get_settings
+
+# Unicode word tokens that keep c++ and c# whole. Hyphens, slashes and dots
+# split words, so "Python/Django" matches "Python" and keywords such as
+# "machine-learning", "CI/CD" or "Node.js" match as multi-token sequences.
+TOKEN_PATTERN = re.compile(r"[\w+#]+")
+
+# Words that carry no signal when keywords are extracted from free text
+STOPWORDS = frozenset("""
+a about above across after all also an and any are as at be been being both but by can could
+do does each either etc for from has have having he her his how if in including into is it its
+job join may more most must need needs of on one or our out over per plus preferred required
+requirements responsibilities role should so such than that the their them then there these they
+this those through to under up us using via was we well were what when where which while who
+will with within work working would years year you your ability able candidate experience
+experienced strong excellent good great knowledge skills skill team teams understanding
+""".split())
+
+def tokenize(text):
+    """
+    Splits text into lowercase tokens
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+def extract_keywords(text):
+    """
+    Extracts candidate keywords from a job description, in order of first use
+    """
+    keywords = {}
+    for token in tokenize(text):
+        if len(token) > 1 and not token.isdigit() and token not in STOPWORDS:
+            keywords.setdefault(token, None)
+    return list(keywords)
+
+def resume_sections(resume_data):
+    """
+    Returns the searchable text fields of a resume grouped by template section
+    """
+    return {
+        'summary': [resume_data.summary],
+        'experience': [
+            text
+            for exp in resume_data.experience
+            for text in (exp.position, *exp.description)
+        ],
+        'education': [
+            text
+            for edu in resume_data.education
+            for text in (edu.degree, edu.field_of_study)
+        ],
+        'skills': [
+            s
+            for skill in resume_data.skills
+            for s in skill.skills
+        ]
+    }
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over normalized tokens.
+
+    Each keyword is a sequence of tokens, so multi-word keywords such as
+    "machine learning" match across whitespace and punctuation differences
+    while "java" never matches inside "javascript". Scanning a text is a
+    single pass over its tokens regardless of the number of keywords.
+    """
+    def __init__(self, keywords):
+        self.keywords = []
+        self.dropped = []
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        seen = set()
+        for keyword in keywords:
+            tokens = tuple(tokenize(keyword))
+            if not tokens:
+                # Nothing matchable, e.g. punctuation only
+                self.dropped.append(keyword)
+                continue
+            if tokens in seen:
+                continue
+            seen.add(tokens)
+            self._add(tokens, len(self.keywords))
+            self.keywords.append(keyword.strip())
+        self._build_failure_links()
+
+    def _add(self, tokens, keyword_id):
+        state = 0
+        for token in tokens:
+            next_state = self.goto[state].get(token)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[state][token] = next_state
+            state = next_state
+        self.output[state].append(keyword_id)
+
+    def _build_failure_links(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and token not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(token, 0)
+                self.output[next_state].extend(self.output[self.fail[next_state]])
+
+    def find(self, texts):
+        """
+        Returns the ids of all keywords found in any of the texts
+        """
+        goto, fail, output = self.goto, self.fail, self.output
+        found = set()
+        for text in texts:
+            # Restart for each text so keywords never span two fields
+            state = 0
+            for token in tokenize(text):
+                while state and token not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(token, 0)
+                if output[state]:
+                    found.update(output[state])
+        return found
+
+    def score(self, resume_data):
+        """
+        Scores a resume against the keywords, overall and per section
+        """
+        total = len(self.keywords)
+        matched = set()
+        sections = {}
+        for section, texts in resume_sections(resume_data).items():
+            found = self.find(texts)
+            matched |= found
+            sections[section] = {
+                'matched': [self.keywords[i] for i in sorted(found)],
+                'coverage': round(len(found) / total, 4) if total else 0.0
+            }
+        return {
+            'full_name': resume_data.full_name,
+            'coverage': round(len(matched) / total, 4) if total else 0.0,
+            'matched': [self.keywords[i] for i in sorted(matched)],
+            'missing': [k for i, k in enumerate(self.keywords) if i not in matched],
+            'sections': sections
+        }
+
+@lru_cache(maxsize=get_settings().MATCHER_CACHE_SIZE)
+def get_matcher(job_description, keywords=None):
+    """
+    Get the matcher for a job description, building it on first use.
+
+    Explicit keywords take precedence over keywords extracted from the text.
+    Keywords must be passed as a tuple so the call can be cached.
+    """
+    return KeywordMatcher(keywords if keywords else extract_keywords(job_description))
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import weakref
+from fastapi.concurrency import run_in_threadpool
+from .resume_generator import render_resume
+
+# One render lock per user, shared by all of that user's preview connections.
+# Entries disappear once no session holds a reference to the lock.
+_render_locks = weakref.WeakValueDictionary()
+
+def get_render_lock(user_id):
+    lock = _render_locks.get(user_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _render_locks[user_id] = lock
+    return lock
+
+class PreviewSession:
+    """
+    Live preview state for a single WebSocket connection.
+
+    Snapshots are numbered as they arrive. The render loop waits until no new
+    snapshot has arrived for ``debounce`` seconds, renders only the latest one,
+    and drops the result if a newer snapshot came in while it was rendering.
+    """
+    def __init__(self, websocket, user_id, debounce):
+        self.websocket = websocket
+        self.debounce = debounce
+        self.render_lock = get_render_lock(user_id)
+        self.version = 0
+        self.latest = None
+        self.changed = asyncio.Event()
+
+    def submit(self, resume_data):
+        self.version += 1
+        self.latest = resume_data
+        self.changed.set()
+        return self.version
+
+    async def wait_for_quiet(self):
+        # Restart the debounce window every time a new snapshot arrives
+        while True:
+            self.changed.clear()
+            try:
+                await asyncio.wait_for(self.changed.wait(), self.debounce)
+            except asyncio.TimeoutError:
+                return
+
+    async def run(self):
+        while True:
+            await self.changed.wait()
+            await self.wait_for_quiet()
+            version, resume_data = self.version, self.latest
+
+            async with self.render_lock:
+                # Skip snapshots superseded while waiting for another render
+                if version != self.version:
+                    continue
+                render = asyncio.ensure_future(run_in_threadpool(render_resume, resume_data))
+                try:
+                    pdf = await asyncio.shield(render)
+                except asyncio.CancelledError:
+                    # The render thread cannot be interrupted, so keep holding
+                    # the user's lock until it has actually finished
+                    await asyncio.gather(render, return_exceptions=True)
+                    raise
+                except Exception as e:
+                    await self.websocket.send_json({"version": version, "error": str(e)})
+                    continue
+
+            # Drop renders superseded while they were in flight
+            if version != self.version:
+                continue
+            await self.websocket.send_json({"version": version, "size": len(pdf)})
+            await self.websocket.send_bytes(pdf)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+
+# Table style shared by every render. Table only reads its style commands,
+# so it is built once at import and must never be modified.
+CONTACT_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+])
+
+CONTACT_ICONS = {
+    'email': '✉',
+    'phone': '☎',
+    'linkedin': '🔗',
+    'default': '•'
+}
+
+def contact_row(icon_type, text, styles):
+    """
+    Creates a row of contact information with a Unicode symbol.
+
+    Args:
+        icon_type (str): Type of contact info ('email', 'phone', or 'linkedin')
+        text (str): Contact information text
+        styles (dict): Template styles providing 'contact' and 'contact_icon'
+
+    Returns:
+        list: The symbol and text cells of one Table row
+    """
+    icon_symbol = CONTACT_ICONS.get(icon_type, CONTACT_ICONS['default'])
+    return [Paragraph(icon_symbol, styles['contact_icon']), Paragraph(text, styles['contact'])]
+
+def contact_block(resume_data, styles, width):
+    """
+    Creates the sidebar contact section, with one table row per available
+    contact detail
+    """
+    rows = [
+        contact_row(icon_type, text, styles)
+        for icon_type, text in (
+            ('email', resume_data.email),
+            ('phone', resume_data.phone),
+            ('linkedin', resume_data.linkedin)
+        )
+        if text
+    ]
+    content = [Paragraph("CONTACT", styles['sidebar_heading']), Spacer(1, 8)]
+    if rows:
+        content.append(Table(rows, colWidths=[12, width - 45], style=CONTACT_TABLE_STYLE))
+    return content
+
+def skill_block(skills, styles):
+    """
+    Creates the sidebar skills section
+    """
+    content = [Paragraph("EXPERTISE", styles['sidebar_heading']), Spacer(1, 10)]
+    for skill in skills:
+        content.append(Paragraph(skill.category.upper(), styles['skill_category']))
+        for s in skill.skills:
+            content.append(Paragraph(f"• {s}", styles['skill_level']))
+        content.append(Spacer(1, 6))
+    return content
+
+def experience_block(experience, styles):
+    """
+    Creates the main column experience section
+    """
+    content = [Paragraph("EXPERIENCE", styles['main_heading']), Spacer(1, 8)]
+    for exp in experience:
+        content.append(Paragraph(exp.position.upper(), styles['main_subheading']))
+        content.append(Paragraph(f"{exp.company} | {exp.start_date} - {exp.end_date if exp.end_date else 'Present'}", styles['main_normal']))
+        for desc in exp.description:
+            content.append(Paragraph(f"• {desc}", styles['main_normal']))
+        content.append(Spacer(1, 12))
+    return content
@@ -1,43 +1,39 @@
 # -*- coding: utf-8 -*-
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.platypus import BaseDocTemplate, SimpleDocTemplate, Paragraph, Spacer, PageBreak
+from reportlab.platypus import DocWhile, Frame, LayoutError, PageTemplate
 from reportlab.lib.units import inch
+from reportlab import Version as REPORTLAB_VERSION
 from datetime import datetime
+from io import BytesIO
+import hashlib
 import os
-from .resume_templates import get_template
+from .resume_templates import get_template, get_template_styles
+from .resume_index import get_resume_index
+from .resume_flowables import contact_block, experience_block, skill_block
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
-def create_contact_line(icon_type, text, style):
-    """
-    Creates a line of contact information with a Unicode symbol.
-    
-    Args:
-        icon_type (str): Type of contact info ('email', 'phone', or 'linkedin')
-        text (str): Contact information text
-        style (ParagraphStyle): Style for the text
-    
-    Returns:
-        list: A list containing the symbol and text for use in a Table
-    """
-    icons = {
-        'email': '✉',
-        'phone': '☎',
-        'linkedin': '🔗',
-        'default': '•'
-    }
-    
-    icon_style = ParagraphStyle(
-        'Icon',
-        parent=style,
-        fontSize=style.fontSize + 2,
-        textColor=style.textColor,
-        leading=style.leading
-    )
-    
-    icon_symbol = icons.get(icon_type, icons['default'])
-    return [[Paragraph(icon_symbol, icon_style), Paragraph(text, style)]]
+# Bump whenever a code change alters the bytes of rendered PDFs (layout,
+# styles, fonts, document settings). It is part of every ETag, so clients
+# holding a validator for the old output re-download instead of getting a 304.
+RENDER_FORMAT_VERSION = 3
+
+# Page settings shared by all templates. Invariant mode fixes the creation
+# date and document ID so identical input renders identical bytes.
+DOCUMENT_OPTIONS = {
+    'pagesize': letter,
+    'rightMargin': 30,
+    'leftMargin': 30,
+    'topMargin': 30,
+    'bottomMargin': 30,
+    'invariant': True
+}
+
+# Background of the two-column sidebar. It is not part of the theme: the
+# sidebar text is white, so the background has to stay dark.
+SIDEBAR_BACKGROUND = colors.HexColor('#34495e')
 
 def generate_resume(resume_data):
     # Create output directory if it doesn't exist
@@ -49,23 +45,42 @@ def generate_resume(resume_data):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{output_dir}/{resume_data.full_name.replace(' ', '_')}_{timestamp}.pdf"
 
-    # Create the PDF document with adjusted margins
-    doc = SimpleDocTemplate(
-        filename,
-        pagesize=letter,
-        rightMargin=30,
-        leftMargin=30,
-        topMargin=30,
-        bottomMargin=30
-    )
+    build_resume(filename, resume_data)
+    get_resume_index().add(filename, resume_data)
+    return filename
+
+def render_resume(resume_data):
+    """
+    Renders a resume in memory and returns the PDF bytes.
+    """
+    buffer = BytesIO()
+    build_resume(buffer, resume_data)
+    return buffer.getvalue()
+
+def resume_etag(resume_data):
+    """
+    Returns a strong ETag for the PDF rendered from the given data.
+
+    Documents are built in invariant mode, so identical input always renders
+    to identical bytes. The tag can therefore be computed from the input, the
+    render format and the ReportLab version without rendering.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{RENDER_FORMAT_VERSION}:{REPORTLAB_VERSION}:".encode())
+    digest.update(resume_data.model_dump_json().encode())
+    return f'"{digest.hexdigest()}"'
 
+def build_resume(output, resume_data):
     # Get the selected template
     template = get_template(resume_data.template_name)
-    styles = template.get_styles()
+    styles = get_template_styles(resume_data.template_name, resume_data.theme)
 
+    # Create the PDF document with adjusted margins
     if template.get_template_type() == "two_column":
+        doc = BaseDocTemplate(output, **DOCUMENT_OPTIONS)
         return generate_two_column_resume(doc, resume_data, styles)
     else:
+        doc = SimpleDocTemplate(output, **DOCUMENT_OPTIONS)
         return generate_single_column_resume(doc, resume_data, styles)
 
 def generate_single_column_resume(doc, resume_data, styles):
@@ -123,11 +138,50 @@ def generate_single_column_resume(doc, resume_data, styles):
     doc.build(content)
     return doc.filename
 
-def generate_two_column_resume(doc, resume_data, styles):
+def column_widths(doc):
     # Calculate column widths with adjusted margins
     page_width = letter[0] - doc.leftMargin - doc.rightMargin
     sidebar_width = page_width * 0.32  # Slightly wider sidebar
     main_width = page_width * 0.68     # Adjusted main content
+    return sidebar_width, main_width
+
+def two_column_page_templates(doc):
+    """
+    Page templates for the two-column layout. The main column is the story's
+    only frame; the sidebar content waiting in doc.sidebar_pending is drawn
+    into a narrow frame beside it on every page until it runs out.
+    """
+    sidebar_width, main_width = column_widths(doc)
+    main_x = doc.leftMargin + sidebar_width
+
+    def draw_sidebar(canvas, doc):
+        if not doc.sidebar_pending:
+            return
+        canvas.saveState()
+        canvas.setFillColor(SIDEBAR_BACKGROUND)
+        canvas.rect(0, 0, main_x, letter[1], stroke=0, fill=1)
+        canvas.restoreState()
+
+        pending = len(doc.sidebar_pending)
+        sidebar_frame = Frame(doc.leftMargin, doc.bottomMargin, sidebar_width, doc.height, id='sidebar')
+        sidebar_frame.addFromList(doc.sidebar_pending, canvas)
+        if len(doc.sidebar_pending) == pending:
+            raise LayoutError(f"Sidebar flowable {doc.sidebar_pending[0]!r} does not fit on an empty page")
+
+    main_frame = Frame(main_x, doc.bottomMargin, main_width, doc.height, id='main')
+    return [PageTemplate(id='two_column', frames=[main_frame], onPage=draw_sidebar)]
+
+def generate_two_column_resume(doc, resume_data, styles):
+    sidebar_content, main_content = build_two_column_story(doc, resume_data, styles)
+    doc.sidebar_pending = list(sidebar_content)
+    doc.addPageTemplates(two_column_page_templates(doc))
+
+    # Build the PDF, adding pages while the sidebar is longer than the main column
+    doc.build([*main_content, DocWhile('doc.sidebar_pending', [PageBreak()])])
+    return doc.filename
+
+def build_two_column_story(doc, resume_data, styles):
+    sidebar_width, main_width = column_widths(doc)
 
     # Prepare sidebar content (left column)
     sidebar_content = []
@@ -145,64 +199,11 @@ def generate_two_column_resume(doc, resume_data, styles):
     sidebar_content.append(Spacer(1, 20))
 
     # Contact Information with icons
-    sidebar_content.append(Paragraph("CONTACT", styles['sidebar_heading']))
-    sidebar_content.append(Spacer(1, 8))
-    
-    # Email
-    if resume_data.email:
-        email_table = Table(
-            create_contact_line("email", resume_data.email, styles['contact']),
-            colWidths=[12, sidebar_width-45],
-            style=TableStyle([
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ])
-        )
-        sidebar_content.append(email_table)
-
-    # Phone
-    if resume_data.phone:
-        phone_table = Table(
-            create_contact_line("phone", resume_data.phone, styles['contact']),
-            colWidths=[12, sidebar_width-45],
-            style=TableStyle([
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ])
-        )
-        sidebar_content.append(phone_table)
-
-    # LinkedIn
-    if resume_data.linkedin:
-        linkedin_table = Table(
-            create_contact_line("linkedin", resume_data.linkedin, styles['contact']),
-            colWidths=[12, sidebar_width-45],
-            style=TableStyle([
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ])
-        )
-        sidebar_content.append(linkedin_table)
-
+    sidebar_content.extend(contact_block(resume_data, styles, sidebar_width))
     sidebar_content.append(Spacer(1, 25))
 
     # Skills in sidebar
-    sidebar_content.append(Paragraph("EXPERTISE", styles['sidebar_heading']))
-    sidebar_content.append(Spacer(1, 10))
-    for skill in resume_data.skills:
-        sidebar_content.append(Paragraph(skill.category.upper(), styles['skill_category']))
-        for s in skill.skills:
-            sidebar_content.append(Paragraph(f"• {s}", styles['skill_level']))
-        sidebar_content.append(Spacer(1, 6))
+    sidebar_content.extend(skill_block(resume_data.skills, styles))
 
     # Prepare main content (right column)
     main_content = []
@@ -215,14 +216,7 @@ def generate_two_column_resume(doc, resume_data, styles):
     main_content.append(Spacer(1, 20))
 
     # Experience in main content
-    main_content.append(Paragraph("EXPERIENCE", styles['main_heading']))
-    main_content.append(Spacer(1, 8))
-    for exp in resume_data.experience:
-        main_content.append(Paragraph(exp.position.upper(), styles['main_subheading']))
-        main_content.append(Paragraph(f"{exp.company} | {exp.start_date} - {exp.end_date if exp.end_date else 'Present'}", styles['main_normal']))
-        for desc in exp.description:
-            main_content.append(Paragraph(f"• {desc}", styles['main_normal']))
-        main_content.append(Spacer(1, 12))
+    main_content.extend(experience_block(resume_data.experience, styles))
 
     # Education in main content
     main_content.append(Paragraph("EDUCATION", styles['main_heading']))
@@ -236,17 +230,6 @@ def generate_two_column_resume(doc, resume_data, styles):
         main_content.append(Paragraph(f"{edu.start_date} - {edu.end_date if edu.end_date else 'Present'}", styles['main_normal']))
         main_content.append(Spacer(1, 12))
 
-    # Create the two-column layout
-    table_data = [[Table(sidebar_content, colWidths=[sidebar_width]), Table(main_content, colWidths=[main_width])]]
-    table = Table(table_data, colWidths=[sidebar_width, main_width])
-    table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-    ]))
-
-    # Build the PDF
-    doc.build([table])
-    return doc.filename 
\ No newline at end of file
+    # The two columns flow independently: the main column is the story and
+    # the sidebar is drawn beside it page by page
+    return sidebar_content, main_content
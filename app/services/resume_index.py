@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+import logging
+import os
+import queue
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+from functools import lru_cache
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS resumes USING fts5(
+    file_path UNINDEXED,
+    created_at UNINDEXED,
+    full_name,
+    profession,
+    skills,
+    companies,
+    bullets,
+    tokenize = 'porter unicode61'
+)
+"""
+
+# bm25 column weights, in schema order: names and titles outrank bullet text
+RANK_WEIGHTS = (0.0, 0.0, 10.0, 5.0, 3.0, 2.0, 1.0)
+
+# Snippets are plain text: matched terms are wrapped in these control
+# characters rather than HTML tags, so clients highlight them after escaping
+# the text themselves
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+SEARCH_SQL = f"""
+SELECT file_path, created_at, full_name, profession,
+       bm25(resumes, {', '.join(map(str, RANK_WEIGHTS))}) AS rank,
+       snippet(resumes, -1, '{MATCH_START}', '{MATCH_END}', '...', 12) AS snippet
+FROM resumes
+WHERE resumes MATCH ?
+ORDER BY rank
+LIMIT ? OFFSET ?
+"""
+
+COUNT_SQL = "SELECT count(*) FROM resumes WHERE resumes MATCH ?"
+
+INSERT_SQL = "INSERT INTO resumes VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+DELETE_SQL = "DELETE FROM resumes WHERE file_path IN ({})"
+
+def build_match_query(query):
+    """
+    Turns free text into an FTS5 query matching all of its words.
+
+    Every word is quoted so characters such as '-', '+' or ':' in user input
+    are never parsed as FTS5 operators.
+    """
+    terms = re.findall(r"\w+", query)
+    return " ".join(f'"{term}"' for term in terms)
+
+def index_row(file_path, resume_data):
+    skills = [s for skill in resume_data.skills for s in (skill.category, *skill.skills)]
+    return (
+        file_path,
+        datetime.now().isoformat(timespec="seconds"),
+        resume_data.full_name,
+        resume_data.profession or "",
+        " ".join(skills),
+        " ".join(exp.company for exp in resume_data.experience),
+        "\n".join(
+            text
+            for exp in resume_data.experience
+            for text in (exp.position, *exp.description)
+        )
+    )
+
+class ResumeIndex:
+    """
+    Local SQLite FTS5 index over generated resumes.
+
+    Writes are queued and applied by a background thread, which commits
+    everything queued since its last write in a single transaction, so
+    indexing never adds latency to rendering.
+    """
+    def __init__(self, path, batch_size=100):
+        self.path = path
+        self.batch_size = batch_size
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(SCHEMA)
+            conn.commit()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def add(self, file_path, resume_data):
+        """
+        Queue a generated resume for indexing
+        """
+        self._queue.put(index_row(file_path, resume_data))
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._run, name="resume-index-writer", daemon=True)
+                    self._writer.start()
+
+    def _run(self):
+        conn = self._connect()
+        try:
+            running = True
+            while running:
+                batch = [self._queue.get()]
+                # Drain whatever else is waiting into the same transaction
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if None in batch:
+                    running = False
+                    batch = [row for row in batch if row is not None]
+                if batch:
+                    # A regenerated file replaces its previous entry; within a
+                    # batch the latest row for each file wins
+                    rows = list({row[0]: row for row in batch}.values())
+                    try:
+                        with conn:
+                            conn.execute(DELETE_SQL.format(", ".join("?" * len(rows))), [row[0] for row in rows])
+                            conn.executemany(INSERT_SQL, rows)
+                    except sqlite3.Error:
+                        logger.exception("Failed to index %d resumes", len(batch))
+        finally:
+            conn.close()
+
+    def close(self):
+        """
+        Write all queued entries and stop the writer thread
+        """
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+
+    def search(self, query, limit=20, offset=0):
+        """
+        Ranked full-text search. Returns the total number of hits and one page
+        of results, best match first.
+        """
+        match = build_match_query(query)
+        if not match:
+            return 0, []
+        with closing(self._connect()) as conn:
+            conn.row_factory = sqlite3.Row
+            total = conn.execute(COUNT_SQL, (match,)).fetchone()[0]
+            rows = conn.execute(SEARCH_SQL, (match, limit, offset)).fetchall()
+        results = [
+            {
+                "file_path": row["file_path"],
+                "full_name": row["full_name"],
+                "profession": row["profession"] or None,
+                "created_at": row["created_at"],
+                "score": -row["rank"],
+                "snippet": row["snippet"]
+            }
+            for row in rows
+        ]
+        return total, results
+
+@lru_cache()
+def get_resume_index():
+    settings = get_settings()
+    return ResumeIndex(settings.SEARCH_INDEX_PATH, settings.SEARCH_INDEX_BATCH_SIZE)
+
+def close_resume_index():
+    """
+    Flush and stop the index writer, without creating the index if it was
+    never opened
+    """
+    if get_resume_index.cache_info().currsize:
+        get_resume_index().close()
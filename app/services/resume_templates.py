@@ -6,138 +6,184 @@ from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
 from reportlab.platypus import Paragraph, Spacer, Table, TableStyle, Frame, Image
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
+from functools import lru_cache
 import os
+from app.core.config import get_settings
+from app.models.schemas import Theme
+
+# Regular and bold faces of the built-in PDF font families
+FONT_FAMILIES = {
+    'Helvetica': {'regular': 'Helvetica', 'bold': 'Helvetica-Bold'},
+    'Times-Roman': {'regular': 'Times-Roman', 'bold': 'Times-Bold'},
+    'Courier': {'regular': 'Courier', 'bold': 'Courier-Bold'}
+}
 
 class ResumeTemplate:
+    default_theme = Theme(
+        primary_color='#000000',
+        accent_color='#000000',
+        text_color='#000000',
+        font_family='Helvetica',
+        base_font_size=10
+    )
+
     def __init__(self):
         self.styles = getSampleStyleSheet()
         
-    def get_styles(self):
+    def resolve_theme(self, theme=None):
+        """
+        Fill the unset fields of a theme with this template's defaults
+        """
+        if theme is None:
+            return self.default_theme
+        return self.default_theme.model_copy(update=theme.model_dump(exclude_none=True))
+
+    def get_styles(self, theme=None):
         raise NotImplementedError
         
     def get_template_type(self):
         return "single_column"
 
 class ModernTwoColumnTemplate(ResumeTemplate):
+    default_theme = Theme(
+        primary_color='#1976D2',
+        accent_color='#4FC3F7',
+        text_color='#424242',
+        font_family='Helvetica',
+        base_font_size=10
+    )
+
     def get_template_type(self):
         return "two_column"
         
-    def get_styles(self, scale_factor=1.0):
+    def get_styles(self, theme=None):
         # Modern two-column template with elegant styling
+        theme = self.resolve_theme(theme)
+        fonts = FONT_FAMILIES[theme.font_family]
+        scale_factor = theme.base_font_size / self.default_theme.base_font_size
+
         title_style = ParagraphStyle(
             'CustomTitle',
             parent=self.styles['Heading1'],
-            fontSize=int(26 * scale_factor),
-            spaceAfter=int(2 * scale_factor),
+            fontSize=26 * scale_factor,
+            spaceAfter=2 * scale_factor,
             textColor=colors.white,
             alignment=TA_LEFT,
-            leading=int(32 * scale_factor),
-            fontName='Helvetica-Bold',
+            leading=32 * scale_factor,
+            fontName=fonts['bold'],
             letterSpacing=1
         )
 
         subtitle_style = ParagraphStyle(
             'SubTitle',
             parent=self.styles['Normal'],
-            fontSize=int(12 * scale_factor),
+            fontSize=12 * scale_factor,
             textColor=colors.HexColor('#E8E8E8'),
             alignment=TA_LEFT,
-            leading=int(14 * scale_factor),
-            spaceAfter=int(25 * scale_factor),
-            fontName='Helvetica',
+            leading=14 * scale_factor,
+            spaceAfter=25 * scale_factor,
+            fontName=fonts['regular'],
             letterSpacing=0.5
         )
         
         sidebar_heading_style = ParagraphStyle(
             'SidebarHeading',
             parent=self.styles['Heading2'],
-            fontSize=int(13 * scale_factor),
-            spaceAfter=int(10 * scale_factor),
-            textColor=colors.HexColor('#4FC3F7'),
+            fontSize=13 * scale_factor,
+            spaceAfter=10 * scale_factor,
+            textColor=colors.HexColor(theme.accent_color),
             alignment=TA_LEFT,
-            fontName='Helvetica-Bold',
-            leading=int(15 * scale_factor),
+            fontName=fonts['bold'],
+            leading=15 * scale_factor,
             letterSpacing=1
         )
         
         sidebar_normal_style = ParagraphStyle(
             'SidebarNormal',
             parent=self.styles['Normal'],
-            fontSize=int(9 * scale_factor),
+            fontSize=9 * scale_factor,
             textColor=colors.white,
-            spaceAfter=int(4 * scale_factor),
+            spaceAfter=4 * scale_factor,
             alignment=TA_LEFT,
-            leading=int(11 * scale_factor),
-            fontName='Helvetica-Light'
+            leading=11 * scale_factor,
+            fontName=fonts['regular']
         )
 
         contact_style = ParagraphStyle(
             'ContactStyle',
             parent=self.styles['Normal'],
-            fontSize=int(9 * scale_factor),
+            fontSize=9 * scale_factor,
             textColor=colors.HexColor('#E0E0E0'),
-            spaceAfter=int(4 * scale_factor),
+            spaceAfter=4 * scale_factor,
             alignment=TA_LEFT,
-            leading=int(11 * scale_factor),
-            leftIndent=int(20 * scale_factor),
-            fontName='Helvetica-Light'
+            leading=11 * scale_factor,
+            leftIndent=20 * scale_factor,
+            fontName=fonts['regular']
+        )
+
+        contact_icon_style = ParagraphStyle(
+            'Icon',
+            parent=contact_style,
+            fontSize=contact_style.fontSize + 2,
+            textColor=contact_style.textColor,
+            leading=contact_style.leading
         )
         
         main_heading_style = ParagraphStyle(
             'MainHeading',
             parent=self.styles['Heading2'],
-            fontSize=int(16 * scale_factor),
-            spaceAfter=int(12 * scale_factor),
-            textColor=colors.HexColor('#1976D2'),
-            spaceBefore=int(12 * scale_factor),
-            fontName='Helvetica-Bold',
-            leading=int(18 * scale_factor),
+            fontSize=16 * scale_factor,
+            spaceAfter=12 * scale_factor,
+            textColor=colors.HexColor(theme.primary_color),
+            spaceBefore=12 * scale_factor,
+            fontName=fonts['bold'],
+            leading=18 * scale_factor,
             letterSpacing=0.8
         )
         
         main_normal_style = ParagraphStyle(
             'MainNormal',
             parent=self.styles['Normal'],
-            fontSize=int(10 * scale_factor),
-            textColor=colors.HexColor('#424242'),
-            spaceAfter=int(6 * scale_factor),
-            leading=int(14 * scale_factor),
-            fontName='Helvetica',
+            fontSize=10 * scale_factor,
+            textColor=colors.HexColor(theme.text_color),
+            spaceAfter=6 * scale_factor,
+            leading=14 * scale_factor,
+            fontName=fonts['regular'],
             alignment=TA_JUSTIFY
         )
 
         main_subheading_style = ParagraphStyle(
             'MainSubheading',
             parent=self.styles['Normal'],
-            fontSize=int(12 * scale_factor),
-            textColor=colors.HexColor('#1976D2'),
-            spaceAfter=int(2 * scale_factor),
-            fontName='Helvetica-Bold',
-            leading=int(14 * scale_factor),
+            fontSize=12 * scale_factor,
+            textColor=colors.HexColor(theme.primary_color),
+            spaceAfter=2 * scale_factor,
+            fontName=fonts['bold'],
+            leading=14 * scale_factor,
             letterSpacing=0.5
         )
         
         skill_category_style = ParagraphStyle(
             'SkillCategory',
             parent=self.styles['Normal'],
-            fontSize=int(10 * scale_factor),
-            textColor=colors.HexColor('#4FC3F7'),
+            fontSize=10 * scale_factor,
+            textColor=colors.HexColor(theme.accent_color),
             alignment=TA_LEFT,
-            fontName='Helvetica-Bold',
-            spaceBefore=int(8 * scale_factor),
-            leading=int(12 * scale_factor),
+            fontName=fonts['bold'],
+            spaceBefore=8 * scale_factor,
+            leading=12 * scale_factor,
             letterSpacing=0.5
         )
 
         skill_level_style = ParagraphStyle(
             'SkillLevel',
             parent=self.styles['Normal'],
-            fontSize=int(9 * scale_factor),
+            fontSize=9 * scale_factor,
             textColor=colors.HexColor('#E0E0E0'),
             alignment=TA_LEFT,
-            spaceAfter=int(2 * scale_factor),
-            leading=int(11 * scale_factor),
-            fontName='Helvetica-Light',
+            spaceAfter=2 * scale_factor,
+            leading=11 * scale_factor,
+            fontName=fonts['regular'],
             leftIndent=10
         )
         
@@ -147,6 +193,7 @@ class ModernTwoColumnTemplate(ResumeTemplate):
             'sidebar_heading': sidebar_heading_style,
             'sidebar_normal': sidebar_normal_style,
             'contact': contact_style,
+            'contact_icon': contact_icon_style,
             'main_heading': main_heading_style,
             'main_normal': main_normal_style,
             'main_subheading': main_subheading_style,
@@ -155,31 +202,41 @@ class ModernTwoColumnTemplate(ResumeTemplate):
         }
 
 class ATSFriendlyTemplate(ResumeTemplate):
-    def get_styles(self):
+    def get_styles(self, theme=None):
         # Simple, clean styles optimized for ATS
+        theme = self.resolve_theme(theme)
+        fonts = FONT_FAMILIES[theme.font_family]
+        scale_factor = theme.base_font_size / self.default_theme.base_font_size
+
         title_style = ParagraphStyle(
             'CustomTitle',
             parent=self.styles['Heading1'],
-            fontSize=16,
+            fontSize=16 * scale_factor,
+            leading=self.styles['Heading1'].leading * scale_factor,
             spaceAfter=20,
-            textColor=colors.black
+            textColor=colors.HexColor(theme.primary_color),
+            fontName=fonts['bold']
         )
         
         heading_style = ParagraphStyle(
             'CustomHeading',
             parent=self.styles['Heading2'],
-            fontSize=12,
+            fontSize=12 * scale_factor,
+            leading=self.styles['Heading2'].leading * scale_factor,
             spaceAfter=10,
-            textColor=colors.black,
-            spaceBefore=15
+            textColor=colors.HexColor(theme.accent_color),
+            spaceBefore=15,
+            fontName=fonts['bold']
         )
         
         normal_style = ParagraphStyle(
             'CustomNormal',
             parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.black,
-            spaceAfter=6
+            fontSize=10 * scale_factor,
+            leading=self.styles['Normal'].leading * scale_factor,
+            textColor=colors.HexColor(theme.text_color),
+            spaceAfter=6,
+            fontName=fonts['regular']
         )
         
         return {
@@ -189,35 +246,53 @@ class ATSFriendlyTemplate(ResumeTemplate):
         }
 
 class ModernATSTemplate(ResumeTemplate):
-    def get_styles(self):
+    default_theme = Theme(
+        primary_color='#1a237e',
+        accent_color='#0d47a1',
+        text_color='#000000',
+        font_family='Helvetica',
+        base_font_size=11
+    )
+
+    def get_styles(self, theme=None):
         # Modern styles with colors while maintaining ATS compatibility
+        theme = self.resolve_theme(theme)
+        fonts = FONT_FAMILIES[theme.font_family]
+        scale_factor = theme.base_font_size / self.default_theme.base_font_size
+
         title_style = ParagraphStyle(
             'CustomTitle',
             parent=self.styles['Heading1'],
-            fontSize=24,
+            fontSize=24 * scale_factor,
+            leading=self.styles['Heading1'].leading * scale_factor,
             spaceAfter=20,
-            textColor=colors.HexColor('#1a237e'),
-            alignment=TA_CENTER
+            textColor=colors.HexColor(theme.primary_color),
+            alignment=TA_CENTER,
+            fontName=fonts['bold']
         )
         
         heading_style = ParagraphStyle(
             'CustomHeading',
             parent=self.styles['Heading2'],
-            fontSize=14,
+            fontSize=14 * scale_factor,
+            leading=self.styles['Heading2'].leading * scale_factor,
             spaceAfter=12,
-            textColor=colors.HexColor('#0d47a1'),
+            textColor=colors.HexColor(theme.accent_color),
             spaceBefore=15,
-            borderColor=colors.HexColor('#1a237e'),
+            borderColor=colors.HexColor(theme.primary_color),
             borderWidth=1,
-            borderPadding=5
+            borderPadding=5,
+            fontName=fonts['bold']
         )
         
         normal_style = ParagraphStyle(
             'CustomNormal',
             parent=self.styles['Normal'],
-            fontSize=11,
-            textColor=colors.black,
-            spaceAfter=8
+            fontSize=11 * scale_factor,
+            leading=self.styles['Normal'].leading * scale_factor,
+            textColor=colors.HexColor(theme.text_color),
+            spaceAfter=8,
+            fontName=fonts['regular']
         )
         
         return {
@@ -227,35 +302,45 @@ class ModernATSTemplate(ResumeTemplate):
         }
 
 class ClassicTemplate(ResumeTemplate):
-    def get_styles(self):
+    def get_styles(self, theme=None):
         # Traditional black and white template
+        theme = self.resolve_theme(theme)
+        fonts = FONT_FAMILIES[theme.font_family]
+        scale_factor = theme.base_font_size / self.default_theme.base_font_size
+
         title_style = ParagraphStyle(
             'CustomTitle',
             parent=self.styles['Heading1'],
-            fontSize=18,
+            fontSize=18 * scale_factor,
+            leading=self.styles['Heading1'].leading * scale_factor,
             spaceAfter=20,
-            textColor=colors.black,
-            alignment=TA_CENTER
+            textColor=colors.HexColor(theme.primary_color),
+            alignment=TA_CENTER,
+            fontName=fonts['bold']
         )
         
         heading_style = ParagraphStyle(
             'CustomHeading',
             parent=self.styles['Heading2'],
-            fontSize=12,
+            fontSize=12 * scale_factor,
+            leading=self.styles['Heading2'].leading * scale_factor,
             spaceAfter=10,
-            textColor=colors.black,
+            textColor=colors.HexColor(theme.accent_color),
             spaceBefore=15,
             borderWidth=0.5,
             borderPadding=5,
-            borderColor=colors.black
+            borderColor=colors.HexColor(theme.primary_color),
+            fontName=fonts['bold']
         )
         
         normal_style = ParagraphStyle(
             'CustomNormal',
             parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.black,
-            spaceAfter=6
+            fontSize=10 * scale_factor,
+            leading=self.styles['Normal'].leading * scale_factor,
+            textColor=colors.HexColor(theme.text_color),
+            spaceAfter=6,
+            fontName=fonts['regular']
         )
         
         return {
@@ -265,35 +350,53 @@ class ClassicTemplate(ResumeTemplate):
         }
 
 class ProfessionalATSTemplate(ResumeTemplate):
-    def get_styles(self):
+    default_theme = Theme(
+        primary_color='#2c3e50',
+        accent_color='#34495e',
+        text_color='#000000',
+        font_family='Helvetica',
+        base_font_size=10
+    )
+
+    def get_styles(self, theme=None):
         # Professional template with subtle colors
+        theme = self.resolve_theme(theme)
+        fonts = FONT_FAMILIES[theme.font_family]
+        scale_factor = theme.base_font_size / self.default_theme.base_font_size
+
         title_style = ParagraphStyle(
             'CustomTitle',
             parent=self.styles['Heading1'],
-            fontSize=20,
+            fontSize=20 * scale_factor,
+            leading=self.styles['Heading1'].leading * scale_factor,
             spaceAfter=20,
-            textColor=colors.HexColor('#2c3e50'),
-            alignment=TA_CENTER
+            textColor=colors.HexColor(theme.primary_color),
+            alignment=TA_CENTER,
+            fontName=fonts['bold']
         )
         
         heading_style = ParagraphStyle(
             'CustomHeading',
             parent=self.styles['Heading2'],
-            fontSize=13,
+            fontSize=13 * scale_factor,
+            leading=self.styles['Heading2'].leading * scale_factor,
             spaceAfter=10,
-            textColor=colors.HexColor('#34495e'),
+            textColor=colors.HexColor(theme.accent_color),
             spaceBefore=15,
             borderColor=colors.HexColor('#bdc3c7'),
             borderWidth=0.5,
-            borderPadding=5
+            borderPadding=5,
+            fontName=fonts['bold']
         )
         
         normal_style = ParagraphStyle(
             'CustomNormal',
             parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.black,
-            spaceAfter=6
+            fontSize=10 * scale_factor,
+            leading=self.styles['Normal'].leading * scale_factor,
+            textColor=colors.HexColor(theme.text_color),
+            spaceAfter=6,
+            fontName=fonts['regular']
         )
         
         return {
@@ -302,16 +405,32 @@ class ProfessionalATSTemplate(ResumeTemplate):
             'normal': normal_style
         }
 
+# Templates only read their sample stylesheet, so one instance of each is shared
+TEMPLATES = {
+    'modern_two_column': ModernTwoColumnTemplate(),
+    'ats_friendly': ATSFriendlyTemplate(),
+    'modern_ats': ModernATSTemplate(),
+    'classic': ClassicTemplate(),
+    'professional_ats': ProfessionalATSTemplate()
+}
+
 def get_template(template_name: str) -> ResumeTemplate:
     """
     Factory function to get the appropriate resume template
     """
-    templates = {
-        'modern_two_column': ModernTwoColumnTemplate(),
-        'ats_friendly': ATSFriendlyTemplate(),
-        'modern_ats': ModernATSTemplate(),
-        'classic': ClassicTemplate(),
-        'professional_ats': ProfessionalATSTemplate()
-    }
-    
-    return templates.get(template_name, ATSFriendlyTemplate()) 
\ No newline at end of file
+    return TEMPLATES.get(template_name, TEMPLATES['ats_friendly'])
+
+@lru_cache(maxsize=get_settings().STYLE_CACHE_SIZE)
+def _compile_styles(template: ResumeTemplate, theme: Theme) -> dict:
+    return template.get_styles(theme)
+
+def get_template_styles(template_name: str, theme: Theme = None) -> dict:
+    """
+    Get the compiled styles of a template for a theme.
+
+    Style sets are cached per (template, resolved theme) in a bounded LRU, so
+    requests sharing a theme reuse the same ParagraphStyle objects. The
+    returned styles are shared and must not be modified.
+    """
+    template = get_template(template_name)
+    return _compile_styles(template, template.resolve_theme(theme))
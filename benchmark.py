@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmarks for the resume services.
+
+Run with: python benchmark.py
+"""
+import random
+import sys
+import time
+import tracemalloc
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import BaseDocTemplate, Paragraph, Table, TableStyle
+from app.models.schemas import ResumeData
+from app.services.keyword_matcher import get_matcher, resume_sections
+from app.services.resume_generator import DOCUMENT_OPTIONS, build_two_column_story, render_resume
+from app.services.resume_templates import get_template_styles
+
+SKILL_POOL = [
+    "Python", "JavaScript", "TypeScript", "Java", "Go", "Rust", "C++", "C#", "SQL", "PostgreSQL",
+    "MySQL", "MongoDB", "Redis", "Kafka", "RabbitMQ", "Docker", "Kubernetes", "Terraform", "AWS",
+    "GCP", "Azure", "React", "Vue", "Angular", "Node.js", "Django", "FastAPI", "Flask", "Spring",
+    "GraphQL", "REST", "gRPC", "CI/CD", "Jenkins", "GitHub Actions", "Linux", "Bash", "Spark",
+    "Airflow", "Pandas", "NumPy", "PyTorch", "TensorFlow", "machine learning", "data engineering",
+    "microservices", "distributed systems", "system design", "unit testing", "agile"
+]
+
+def make_resume(rng, index, jobs=4):
+    def sentence():
+        return f"Built {' and '.join(rng.sample(SKILL_POOL, 3))} services used by {rng.randint(2, 900)} customers"
+
+    return ResumeData(
+        template_name="modern_two_column",
+        full_name=f"Candidate {index}",
+        profession="Software Engineer",
+        email=f"candidate{index}@example.com",
+        summary=f"Engineer experienced with {', '.join(rng.sample(SKILL_POOL, 6))}.",
+        education=[{
+            "institution": "University of Technology",
+            "degree": "Bachelor of Science",
+            "field_of_study": "Computer Science",
+            "start_date": "2012",
+            "end_date": "2016"
+        }],
+        experience=[{
+            "company": f"Company {j}",
+            "position": rng.choice(["Backend Engineer", "Data Engineer", "Platform Engineer"]),
+            "start_date": "2016",
+            "description": [sentence() for _ in range(5)]
+        } for j in range(jobs)],
+        skills=[{
+            "category": "Technical",
+            "skills": rng.sample(SKILL_POOL, 12)
+        }]
+    )
+
+def naive_score(keywords, resume_data):
+    # Baseline: one substring scan of every section per keyword
+    sections = {
+        section: " ".join(texts).lower()
+        for section, texts in resume_sections(resume_data).items()
+    }
+    return {
+        section: [k for k in keywords if k.lower() in text]
+        for section, text in sections.items()
+    }
+
+def bench_keyword_matching(resumes, keyword_count):
+    batch_size = len(resumes)
+    # Pad the real skills with synthetic ones to model long job descriptions
+    keywords = tuple(SKILL_POOL + [f"framework{i}" for i in range(keyword_count - len(SKILL_POOL))])[:keyword_count]
+    job_description = "Looking for an engineer with " + ", ".join(keywords)
+
+    get_matcher.cache_clear()
+    start = time.perf_counter()
+    matcher = get_matcher(job_description, keywords)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    get_matcher(job_description, keywords)
+    cached_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for resume_data in resumes:
+        matcher.score(resume_data)
+    indexed_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for resume_data in resumes:
+        naive_score(keywords, resume_data)
+    naive_time = time.perf_counter() - start
+
+    print(f"Keyword matching ({batch_size} resumes, {len(matcher.keywords)} keywords)")
+    print(f"  matcher build:   {build_time * 1000:.3f} ms")
+    print(f"  cached lookup:   {cached_time * 1000:.3f} ms")
+    print(f"  indexed scoring: {batch_size / indexed_time:,.0f} resumes/s")
+    print(f"  naive scan:      {batch_size / naive_time:,.0f} resumes/s")
+
+def count_constructions(func, classes):
+    """
+    Calls func and counts how many instances of each class it constructed
+    """
+    codes = {cls.__init__.__code__: cls.__name__ for cls in classes}
+    counts = dict.fromkeys(codes.values(), 0)
+
+    def profile(frame, event, arg):
+        if event == "call" and frame.f_code in codes:
+            counts[codes[frame.f_code]] += 1
+
+    sys.setprofile(profile)
+    try:
+        func()
+    finally:
+        sys.setprofile(None)
+    return counts
+
+def bench_render_allocations(resume_data, renders=200):
+    styles = get_template_styles(resume_data.template_name, resume_data.theme)
+    doc = BaseDocTemplate("unused.pdf", **DOCUMENT_OPTIONS)
+    render_resume(resume_data)  # warm the style cache
+
+    counts = count_constructions(
+        lambda: build_two_column_story(doc, resume_data, styles),
+        (ParagraphStyle, TableStyle, Table, Paragraph)
+    )
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    story = build_two_column_story(doc, resume_data, styles)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    render_resume(resume_data)
+    _, render_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    pdf = render_resume(resume_data)
+    pages = pdf.count(b"/Type /Page\n") + pdf.count(b"/Type /Page ")
+    story_blocks = sum(stat.count_diff for stat in stats)
+    story_bytes = sum(stat.size_diff for stat in stats)
+    del story
+
+    start = time.perf_counter()
+    for _ in range(renders):
+        render_resume(resume_data)
+    render_time = time.perf_counter() - start
+
+    print(f"Two-column render allocations ({len(resume_data.experience)} jobs, {pages}-page PDF, per render)")
+    for name, count in counts.items():
+        print(f"  {name + ':':16} {count}")
+    print(f"  story blocks:    {story_blocks} ({story_bytes / 1024:.1f} KiB)")
+    print(f"  render peak:     {render_peak / 1024:.1f} KiB")
+    print(f"  throughput:      {renders / render_time:,.0f} renders/s")
+
+if __name__ == "__main__":
+    rng = random.Random(42)
+    resumes = [make_resume(rng, i) for i in range(2000)]
+    for keyword_count in (50, 200, 1000):
+        bench_keyword_matching(resumes, keyword_count)
+    for jobs in (2, 8):
+        bench_render_allocations(make_resume(rng, 0, jobs=jobs), renders=100)
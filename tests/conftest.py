@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+import pytest
+from fastapi.testclient import TestClient
+from jose import jwt
+from app.core import security
+
+TEST_SECRET = "test-secret"
+
+@pytest.fixture
+def make_token(monkeypatch):
+    monkeypatch.setattr(security, "JWT_SECRET", TEST_SECRET)
+
+    def make(**claims):
+        return jwt.encode(claims, TEST_SECRET, algorithm=security.ALGORITHM)
+
+    return make
+
+@pytest.fixture
+def auth_headers(make_token):
+    return {"Authorization": f"Bearer {make_token(sub='test-user')}"}
+
+@pytest.fixture
+def client():
+    from main import app
+    return TestClient(app)
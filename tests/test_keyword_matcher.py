@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+from app.models.schemas import ResumeData
+from app.services.keyword_matcher import KeywordMatcher, extract_keywords, tokenize
+
+def found_keywords(matcher, *texts):
+    return sorted(matcher.keywords[i] for i in matcher.find(texts))
+
+def test_tokenize_keeps_tech_terms_and_splits_hyphens():
+    assert tokenize("C++, C#, Node.js and CI/CD; Machine-Learning.") == [
+        "c++", "c#", "node", "js", "and", "ci", "cd", "machine", "learning"
+    ]
+
+def test_tokenize_keeps_unicode_words_whole():
+    assert tokenize("Développeur Zürich 日本語") == ["développeur", "zürich", "日本語"]
+
+def test_whole_token_matching():
+    matcher = KeywordMatcher(["Java", "Go"])
+    assert found_keywords(matcher, "JavaScript and Golang") == []
+    assert found_keywords(matcher, "Java, Go") == ["Go", "Java"]
+
+def test_slash_separated_skills_match_individually():
+    matcher = KeywordMatcher(["Python", "AWS", "React", "JavaScript", "C", "C++", "Django"])
+    assert found_keywords(matcher, "Python/Django, AWS/GCP, React/Redux") == ["AWS", "Django", "Python", "React"]
+    assert found_keywords(matcher, "JavaScript/TypeScript and C/C++") == ["C", "C++", "JavaScript"]
+
+def test_dotted_and_slashed_keywords_match_as_sequences():
+    matcher = KeywordMatcher(["CI/CD", "node.js"])
+    assert found_keywords(matcher, "Owned CI / CD pipelines on Node.js") == ["CI/CD", "node.js"]
+    assert found_keywords(matcher, "Node developer, JS expert") == []
+
+def test_multi_word_keywords():
+    matcher = KeywordMatcher(["machine learning", "node.js"])
+    assert found_keywords(matcher, "Applied Machine-Learning with Node.js.") == ["machine learning", "node.js"]
+    assert found_keywords(matcher, "machine vision", "learning") == []
+
+def test_failure_links_find_overlapping_keywords():
+    matcher = KeywordMatcher(["a b c", "b d", "machine learning", "learning systems", "learning"])
+    assert found_keywords(matcher, "a b d") == ["b d"]
+    assert found_keywords(matcher, "machine learning systems") == [
+        "learning", "learning systems", "machine learning"
+    ]
+
+def test_keywords_never_span_two_texts():
+    matcher = KeywordMatcher(["machine learning"])
+    assert found_keywords(matcher, "machine", "learning") == []
+
+def test_duplicate_and_unmatchable_keywords():
+    matcher = KeywordMatcher(["Python", "python ", "日本語", "!!!"])
+    assert matcher.keywords == ["Python", "日本語"]
+    assert matcher.dropped == ["!!!"]
+
+def test_extract_keywords_skips_stopwords():
+    assert extract_keywords("We need a Python engineer with strong AWS experience") == ["python", "engineer", "aws"]
+
+def test_score_reports_sections_and_missing():
+    resume_data = ResumeData(
+        template_name="ats_friendly",
+        full_name="Frank Graham",
+        email="frank@example.com",
+        summary="Backend engineer focused on Python.",
+        education=[{
+            "institution": "University",
+            "degree": "Master of Science",
+            "field_of_study": "Machine Learning",
+            "start_date": "2018"
+        }],
+        experience=[{
+            "company": "Tech Inc",
+            "position": "Senior Engineer",
+            "start_date": "2020",
+            "description": ["Ran Kubernetes clusters"]
+        }],
+        skills=[{"category": "Programming", "skills": ["Python", "Go"]}]
+    )
+    score = KeywordMatcher(["Python", "Kubernetes", "machine learning", "Rust"]).score(resume_data)
+
+    assert score["coverage"] == 0.75
+    assert score["matched"] == ["Python", "Kubernetes", "machine learning"]
+    assert score["missing"] == ["Rust"]
+    assert score["sections"]["summary"] == {"matched": ["Python"], "coverage": 0.25}
+    assert score["sections"]["experience"]["matched"] == ["Kubernetes"]
+    assert score["sections"]["education"]["matched"] == ["machine learning"]
+    assert score["sections"]["skills"]["matched"] == ["Python"]
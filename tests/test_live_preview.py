@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+import time
+import pytest
+from starlette.websockets import WebSocketDisconnect
+from app.services import live_preview
+from app.services.live_preview import PreviewSession
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+def fake_render(resume_data):
+    return f"pdf:{resume_data}".encode()
+
+def test_debounce_renders_only_latest_snapshot(monkeypatch):
+    renders = []
+    monkeypatch.setattr(live_preview, "render_resume", lambda data: renders.append(data) or fake_render(data))
+
+    async def scenario():
+        websocket = FakeWebSocket()
+        session = PreviewSession(websocket, "debounce-user", debounce=0.05)
+        runner = asyncio.create_task(session.run())
+        for i in range(5):
+            session.submit(f"snapshot-{i}")
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.2)
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+        return websocket.sent
+
+    sent = asyncio.run(scenario())
+    assert renders == ["snapshot-4"]
+    assert sent == [{"version": 5, "size": len(b"pdf:snapshot-4")}, b"pdf:snapshot-4"]
+
+def test_superseded_render_is_dropped(monkeypatch):
+    started = threading.Event()
+
+    def slow_render(resume_data):
+        started.set()
+        time.sleep(0.1)
+        return fake_render(resume_data)
+
+    monkeypatch.setattr(live_preview, "render_resume", slow_render)
+
+    async def scenario():
+        websocket = FakeWebSocket()
+        session = PreviewSession(websocket, "supersede-user", debounce=0.01)
+        runner = asyncio.create_task(session.run())
+        session.submit("old")
+        while not started.is_set():
+            await asyncio.sleep(0.005)
+        session.submit("new")
+        await asyncio.sleep(0.4)
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+        return websocket.sent
+
+    sent = asyncio.run(scenario())
+    assert sent == [{"version": 2, "size": len(b"pdf:new")}, b"pdf:new"]
+
+def test_cancelled_session_holds_lock_until_render_finishes(monkeypatch):
+    started = threading.Event()
+    finished = threading.Event()
+
+    def slow_render(resume_data):
+        started.set()
+        time.sleep(0.1)
+        finished.set()
+        return fake_render(resume_data)
+
+    monkeypatch.setattr(live_preview, "render_resume", slow_render)
+
+    async def scenario():
+        session = PreviewSession(FakeWebSocket(), "cancel-user", debounce=0.01)
+        runner = asyncio.create_task(session.run())
+        session.submit("snapshot")
+        while not started.is_set():
+            await asyncio.sleep(0.005)
+        runner.cancel()
+        await asyncio.sleep(0)
+        assert session.render_lock.locked()
+        await asyncio.gather(runner, return_exceptions=True)
+        assert finished.is_set()
+        assert not session.render_lock.locked()
+
+    asyncio.run(scenario())
+
+def test_preview_rejects_token_without_subject(client, make_token):
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with client.websocket_connect(f"/api/v1/resume/preview?token={make_token(role='editor')}") as websocket:
+            websocket.receive_text()
+    assert exc_info.value.code == 1008
+
+def test_preview_answers_binary_frames_with_error(client, make_token):
+    with client.websocket_connect(f"/api/v1/resume/preview?token={make_token(sub='binary-user')}") as websocket:
+        websocket.send_bytes(b"not json")
+        assert "error" in websocket.receive_json()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import re
+from app.api.endpoints.resume import content_disposition, etag_matches
+from tests.test_resume_generator import make_resume
+
+RENDER_URL = "/api/v1/resume/render"
+
+def render(client, headers, body, **extra_headers):
+    return client.post(RENDER_URL, json=body, headers={**headers, **extra_headers})
+
+def test_render_returns_pdf_with_strong_etag(client, auth_headers):
+    body = make_resume("classic").model_dump(mode="json")
+    response = render(client, auth_headers, body)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert re.fullmatch(r'"[0-9a-f]{64}"', response.headers["etag"])
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert response.content.startswith(b"%PDF")
+    assert render(client, auth_headers, body).content == response.content
+
+def test_matching_etag_returns_304_without_body(client, auth_headers):
+    body = make_resume("classic").model_dump(mode="json")
+    etag = render(client, auth_headers, body).headers["etag"]
+
+    for if_none_match in (etag, f"W/{etag}", f'"other", {etag}'):
+        response = render(client, auth_headers, body, **{"If-None-Match": if_none_match})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert response.headers["cache-control"] == "private, no-cache"
+
+def test_changed_data_or_theme_renders_again(client, auth_headers):
+    body = make_resume("classic").model_dump(mode="json")
+    etag = render(client, auth_headers, body).headers["etag"]
+
+    changed_data = {**body, "summary": "Something else"}
+    changed_theme = {**body, "theme": {"primary_color": "#FF0000"}}
+    for changed in (changed_data, changed_theme):
+        response = render(client, auth_headers, changed, **{"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+def test_wildcard_if_none_match_fails_precondition(client, auth_headers):
+    body = make_resume("classic").model_dump(mode="json")
+    response = render(client, auth_headers, body, **{"If-None-Match": "*"})
+    assert response.status_code == 412
+
+def test_content_disposition_for_non_latin_name(client, auth_headers):
+    body = make_resume("classic").model_dump(mode="json")
+    body["full_name"] = 'Łukasz "Ł" Nowak'
+    response = render(client, auth_headers, body)
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == (
+        'inline; filename="ukasz_Nowak.pdf"; '
+        "filename*=UTF-8''%C5%81ukasz_%22%C5%81%22_Nowak.pdf"
+    )
+
+def test_content_disposition_falls_back_to_generic_name():
+    assert content_disposition("李雷.pdf") == "inline; filename=\"resume.pdf\"; filename*=UTF-8''%E6%9D%8E%E9%9B%B7.pdf"
+
+def test_etag_matches_uses_weak_comparison():
+    assert etag_matches('"a"', '"a"')
+    assert etag_matches('W/"a"', '"a"')
+    assert etag_matches('"b", W/"a"', '"a"')
+    assert not etag_matches('"b"', '"a"')
+    assert not etag_matches("*", '"a"')
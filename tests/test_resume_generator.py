@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import base64
+import re
+import zlib
+import pytest
+from app.models.schemas import ResumeData, Skill
+from app.services.resume_generator import render_resume
+
+TEMPLATES = ["modern_two_column", "ats_friendly", "modern_ats", "classic", "professional_ats"]
+
+def make_resume(template_name, jobs=1, bullets=2):
+    return ResumeData(
+        template_name=template_name,
+        full_name="Frank Graham",
+        profession="Senior Software Engineer",
+        email="frank.graham@example.com",
+        phone="+1 234 567 8900",
+        linkedin="linkedin.com/in/frankgraham",
+        summary="Senior Software Engineer with over 8 years of experience.",
+        education=[{
+            "institution": "University of Technology",
+            "degree": "Master of Science",
+            "field_of_study": "Computer Science",
+            "start_date": "2018",
+            "end_date": "2020",
+            "gpa": 3.9
+        }],
+        experience=[{
+            "company": f"Company {j}",
+            "position": "Software Engineer",
+            "start_date": "2016",
+            "description": [
+                f"Delivered project {k} across several teams, improving reliability and reducing costs"
+                for k in range(bullets)
+            ]
+        } for j in range(jobs)],
+        skills=[{"category": "Programming", "skills": ["Python", "JavaScript", "Java"]}]
+    )
+
+def page_count(pdf):
+    return len(re.findall(rb"/Type /Page\b", pdf))
+
+def page_streams(pdf):
+    """
+    Decoded content of every stream in a ReportLab PDF
+    """
+    return [
+        zlib.decompress(base64.a85decode(data.strip(), adobe=True))
+        for data in re.findall(rb"stream\r?\n(.*?)endstream", pdf, re.S)
+    ]
+
+@pytest.mark.parametrize("template_name", TEMPLATES)
+def test_render_is_byte_stable(template_name):
+    pdf = render_resume(make_resume(template_name))
+    assert pdf.startswith(b"%PDF")
+    assert render_resume(make_resume(template_name)) == pdf
+
+@pytest.mark.parametrize("template_name", TEMPLATES)
+def test_long_resume_flows_onto_more_pages(template_name):
+    pdf = render_resume(make_resume(template_name, jobs=6, bullets=6))
+    assert page_count(pdf) > 1
+
+def test_long_sidebar_continues_on_later_pages():
+    resume_data = make_resume("modern_two_column").model_copy(update={"skills": [
+        Skill(category=f"Category {i}", skills=["Python", "Go", "Rust"])
+        for i in range(40)
+    ]})
+    pages = page_streams(render_resume(resume_data))
+
+    assert len(pages) > 1
+    assert b"ABOUT ME" in pages[0]
+    assert b"CATEGORY 39" in pages[-1]
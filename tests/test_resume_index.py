@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from app.models.schemas import ResumeData
+from app.services.resume_index import MATCH_END, MATCH_START, ResumeIndex, build_match_query
+
+def make_resume(full_name, profession, skills):
+    return ResumeData(
+        template_name="classic",
+        full_name=full_name,
+        profession=profession,
+        email="someone@example.com",
+        summary="Engineer",
+        education=[],
+        experience=[{
+            "company": "Tech Inc",
+            "position": "Engineer",
+            "start_date": "2020",
+            "description": ["Built data pipelines"]
+        }],
+        skills=[{"category": "Programming", "skills": skills}]
+    )
+
+def test_build_match_query_quotes_every_term():
+    assert build_match_query('c++ -- "x" OR:y') == '"c" "x" "OR" "y"'
+    assert build_match_query("--") == ""
+
+def test_search_ranks_and_paginates(tmp_path):
+    index = ResumeIndex(str(tmp_path / "index.db"))
+    index.add("a.pdf", make_resume("Ann Lee", "Python Developer", ["Go"]))
+    index.add("b.pdf", make_resume("Bob Ray", "Designer", ["Python"]))
+    index.add("c.pdf", make_resume("Cy Doe", "Designer", ["Rust"]))
+    index.close()
+
+    total, results = index.search("python")
+    assert total == 2
+    assert [r["file_path"] for r in results] == ["a.pdf", "b.pdf"]
+    assert results[0]["score"] > results[1]["score"] > 0
+
+    total, results = index.search("python", limit=1, offset=1)
+    assert total == 2
+    assert [r["file_path"] for r in results] == ["b.pdf"]
+
+def test_regenerated_file_replaces_its_entry(tmp_path):
+    index = ResumeIndex(str(tmp_path / "index.db"))
+    for _ in range(3):
+        index.add("same.pdf", make_resume("Ann Lee", "Python Developer", ["Go"]))
+    index.close()
+    index.add("same.pdf", make_resume("Ann Lee", "Rust Developer", ["Go"]))
+    index.close()
+
+    assert index.search("ann")[0] == 1
+    assert index.search("python")[0] == 0
+    assert index.search("rust")[0] == 1
+
+def test_snippet_is_plain_text_with_markers(tmp_path):
+    index = ResumeIndex(str(tmp_path / "index.db"))
+    index.add("x.pdf", make_resume('<img src=x onerror="alert(1)"> Ann', "Python Developer", ["Go"]))
+    index.close()
+
+    snippet = index.search("ann")[1][0]["snippet"]
+    assert "<b>" not in snippet
+    assert f"{MATCH_START}Ann{MATCH_END}" in snippet
+    assert '<img src=x onerror="alert(1)">' in snippet
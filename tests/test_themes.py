@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import pytest
+from app.core.config import get_settings
+from app.models.schemas import Theme
+from app.services.resume_generator import render_resume
+from app.services.resume_templates import _compile_styles, get_template, get_template_styles
+from tests.test_resume_generator import make_resume, page_streams
+
+@pytest.mark.parametrize("theme", [
+    {"primary_color": "red"},
+    {"accent_color": "#12345"},
+    {"text_color": "#GGGGGG"},
+    {"font_family": "Comic Sans"},
+    {"base_font_size": 6.5},
+    {"base_font_size": 15}
+])
+def test_invalid_theme_is_rejected(client, auth_headers, theme):
+    body = make_resume("classic").model_dump(mode="json")
+    body["theme"] = theme
+    response = client.post("/api/v1/resume/render", json=body, headers=auth_headers)
+    assert response.status_code == 422
+
+def test_resolve_theme_only_overrides_set_fields():
+    template = get_template("modern_ats")
+    theme = template.resolve_theme(Theme(accent_color="#00FF00", base_font_size=12))
+    assert theme == Theme(
+        primary_color="#1a237e",
+        accent_color="#00ff00",
+        text_color="#000000",
+        font_family="Helvetica",
+        base_font_size=12
+    )
+    assert template.resolve_theme(None) is template.default_theme
+
+def test_equivalent_themes_share_cached_styles():
+    upper = get_template_styles("classic", Theme(primary_color="#FF0000"))
+    lower = get_template_styles("classic", Theme(primary_color="#ff0000"))
+    assert upper is lower
+    assert get_template_styles("classic") is get_template_styles("classic", Theme())
+
+def test_style_cache_evicts_least_recently_used():
+    size = get_settings().STYLE_CACHE_SIZE
+    _compile_styles.cache_clear()
+    first = get_template_styles("classic", Theme(primary_color="#000000"))
+    for i in range(1, size + 1):
+        get_template_styles("classic", Theme(primary_color=f"#{i:06x}"))
+
+    assert _compile_styles.cache_info().currsize == size
+    assert get_template_styles("classic", Theme(primary_color="#000000")) is not first
+
+@pytest.mark.parametrize("template_name", ["classic", "modern_two_column"])
+def test_theme_reaches_rendered_pdf(template_name):
+    default_pdf = render_resume(make_resume(template_name))
+    resume_data = make_resume(template_name)
+    resume_data.theme = Theme(primary_color="#FF0000", font_family="Courier")
+    pdf = render_resume(resume_data)
+
+    assert b"/BaseFont /Courier" not in default_pdf
+    assert b"/BaseFont /Courier" in pdf
+    assert all(b"1 0 0 rg" not in page for page in page_streams(default_pdf))
+    assert any(b"1 0 0 rg" in page for page in page_streams(pdf))